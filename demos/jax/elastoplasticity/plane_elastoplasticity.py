@@ -24,8 +24,10 @@
 #
 # We start by loading the relevant modules. In particular, we will make use of the `QuadratureMap` object available in `dolfinx_materials.quadrature_map` which handles the exchange of information between `FEniCSx` and custom material objects, here a `JAXMaterial`.
 
+import os
 import numpy as np
 import matplotlib.pyplot as plt
+import jax
 import jax.numpy as jnp
 from mpi4py import MPI
 import ufl
@@ -47,7 +49,7 @@ from generate_mesh import generate_perforated_plate
 # $$
 # \sigma_Y(p) = \sigma_0 + (\sigma_u-\sigma_0)\exp(-bp)
 # $$
-# where $\sigma_0$ and $\sigma_u$ are the initial and final yield stresses respectively and $b$ is a hardening parameter controlling the rate of convergence from $\sigma_0$ to $\sigma_u$ as a function of the cumulated plastic strain $p$.
+# where $\sigma_0$ and $\sigma_u$ are the initial and final yield stresses respectively and $b$ is a hardening parameter controlling the rate of convergence from $\sigma_0$ to $\sigma_u$ as a function of the cumulated plastic strain $p$. Since the hardening slope $\sigma_Y'(p) = b(\sigma_u-\sigma_0)\exp(-bp)$ is known in closed form, we pass a `(yield_stress, hardening_slope)` tuple so that the return map consumes the analytical derivative instead of differentiating the yield stress with AutoDiff.
 
 # +
 E, nu = 70e3, 0.3
@@ -59,11 +61,17 @@ sigu = 500.0
 b = 100
 
 
+@jax.jit
 def yield_stress(p):
     return sig0 + (sigu - sig0) * (1 - jnp.exp(-b * p))
 
 
-material = vonMisesIsotropicHardening(elastic_model, yield_stress)
+@jax.jit
+def hardening_slope(p):
+    return b * (sigu - sig0) * jnp.exp(-b * p)
+
+
+material = vonMisesIsotropicHardening(elastic_model, (yield_stress, hardening_slope))
 # -
 
 # ## Problem setup
@@ -99,15 +107,18 @@ bcs = [fem.dirichletbc(uD_t, top_dofs), fem.dirichletbc(uD_b, bottom_dofs)]
 
 
 # +
+SQRT2_INV = fem.Constant(domain, 1.0 / np.sqrt(2))
+
+
 def strain(u):
     return ufl.as_vector(
         [
             u[0].dx(0),
             u[1].dx(1),
-            0.0,
-            1 / np.sqrt(2) * (u[1].dx(0) + u[0].dx(1)),
-            0.0,
-            0.0,
+            ufl.zero(),
+            SQRT2_INV * (u[1].dx(0) + u[0].dx(1)),
+            ufl.zero(),
+            ufl.zero(),
         ]
     )
 
@@ -133,14 +144,19 @@ Jac = qmap.derivative(Res, u, du)
 
 # Next, the custom nonlinear problem is defined with the class `NonlinearMaterialProblem` as well as the corresponding Newton solver.
 
-problem = NonlinearMaterialProblem(qmap, Res, Jac, u, bcs)
+# Optimization flags for the FFCx-generated kernels: the Jacobian
+# tabulate_tensor contracts the 6x6 tangent against the strain of the test and
+# trial functions at each quadrature point and benefits from auto-vectorization.
+jit_options = {"cffi_extra_compile_args": ["-O3", "-march=native"]}
+
+problem = NonlinearMaterialProblem(qmap, Res, Jac, u, bcs, jit_options=jit_options)
 newton = NewtonSolver(MPI.COMM_WORLD)
 newton.rtol = 1e-6
 newton.atol = 1e-6
 newton.convergence_criterion = "residual"
 newton.max_it = 20
 
-# We then loop over a set of imposed vertical strains, apply the corresponding imposed displacement boundary condition on the top surface, solve the problem and then compute plastic and stress fields projected onto a DG space for visualization. Finally, we use the imposed displacement field to compute the associated resultant force in a consistent manner, see [](https://bleyerj.github.io/comet-fenicsx/tips/computing_reactions/computing_reactions.html) for more details.
+# We then loop over a set of imposed vertical strains, apply the corresponding imposed displacement boundary condition on the top surface and solve the problem. We use the imposed displacement field to compute the associated resultant force in a consistent manner, see [](https://bleyerj.github.io/comet-fenicsx/tips/computing_reactions/computing_reactions.html) for more details. Note that the plastic strain and stress fields are only needed for visualization: each `project_on` call solves a global mass system, so we perform these projections once at the final step instead of inside the load-stepping loop.
 
 # +
 out_file = "elastoplasticity.pvd"
@@ -150,24 +166,46 @@ N = 15
 Eyy = np.linspace(0, 15e-3, N + 1)
 Force = np.zeros_like(Eyy)
 nit = np.zeros_like(Eyy)
+
+# The reaction form is compiled once here: rebuilding it at each step would go
+# through the FFCx JIT machinery again, while the compiled form automatically
+# reflects the updated state of u and of the quadrature stress field.
+Force_form = fem.form(ufl.action(Res, u), jit_options=jit_options)
+
+# XLA profiling of the load-stepping loop can be enabled by pointing the
+# DOLFINX_JAX_PROFILE environment variable to a TensorBoard trace directory.
+# It is disabled by default as serializing the trace to disk slows down the
+# constitutive update significantly.
+profile_dir = os.environ.get("DOLFINX_JAX_PROFILE")
+if profile_dir:
+    jax.profiler.start_trace(profile_dir)
+
+# Unit top-boundary displacement profile: the imposed displacement is linear
+# in the applied strain, so each step only rescales this precomputed array.
+uD_profile = np.zeros_like(uD_t.x.array)
+uD_profile[1::2] = Ly
+
 for i, eyy in enumerate(Eyy[1:]):
     u_imp = eyy * Ly
-    uD_t.x.array[1::2] = u_imp
+    uD_t.x.array[:] = eyy * uD_profile
 
     converged, it = problem.solve(newton, print_solution=False)
 
-    p = qmap.project_on("p", ("DG", 0))
-    stress = qmap.project_on("Stress", ("DG", 0))
+    Force[i + 1] = fem.assemble_scalar(Force_form) / u_imp
 
-    Force[i + 1] = fem.assemble_scalar(fem.form(ufl.action(Res, u))) / u_imp
-
-    syy = stress.sub(1).collapse()
-    syy.name = "Stress"
     vtk.write_function(u, i + 1)
-    vtk.write_function(p, i + 1)
-    vtk.write_function(syy, i + 1)
     nit[i + 1] = it
 
+if profile_dir:
+    jax.profiler.stop_trace()
+
+# Final-state diagnostic fields, projected once onto a DG space
+p = qmap.project_on("p", ("DG", 0))
+stress = qmap.project_on("Stress", ("DG", 0))
+syy = stress.sub(1).collapse()
+syy.name = "Stress"
+vtk.write_function(p, N)
+vtk.write_function(syy, N)
 vtk.close()
 # -
 
@@ -1,35 +1,49 @@
+import os
+import subprocess
+import numpy as np
 import mgis.behaviour as mgis_bv
 
 
-path = "/home/hannahk/Dokumente/digitale_Ablage_Promotion/01_Programs/dolfinx_materials/demos/mfront/finite_strain_elastoplasticity/src/libBehaviour.so"
+current_path = os.path.dirname(os.path.abspath(__file__))
+path = os.path.join(current_path, "src/libBehaviour.so")
 name = "SaintVenantKirchhoffElasticity"
+
+# compile the MFront behaviour if needed, the shared library acting as a cache
+if not os.path.exists(path):
+    subprocess.run(
+        ["mfront", "--obuild", "--interface=generic", f"{name}.mfront"],
+        cwd=current_path,
+        check=True,
+    )
+
 hypothesis = mgis_bv.Hypothesis.PlaneStrain
-material_properties={"YoungModulus":2e5,"PoissonRatio": 0.3}        
-integration_type = (
-            mgis_bv.IntegrationType.IntegrationWithConsistentTangentOperator
-        )
+material_properties = {"YoungModulus": 2e5, "PoissonRatio": 0.3}
+integration_type = mgis_bv.IntegrationType.IntegrationWithConsistentTangentOperator
 dt = 1
+N = 100  # number of integration points
 is_finite_strain = mgis_bv.isStandardFiniteStrainBehaviour(path, name)
 assert is_finite_strain
 
 # finite strain options
 bopts = mgis_bv.FiniteStrainBehaviourOptions()
 bopts.stress_measure = mgis_bv.FiniteStrainBehaviourOptionsStressMeasure.PK2
-bopts.tangent_operator = (
-    mgis_bv.FiniteStrainBehaviourOptionsTangentOperator.DS_DEGL
-)
+bopts.tangent_operator = mgis_bv.FiniteStrainBehaviourOptionsTangentOperator.DS_DEGL
 
 b = mgis_bv.load(bopts, path, name, hypothesis)
-bd = mgis_bv.BehaviourData(b)
-bd.dt = dt
-bd.rdt = dt
-bd.K[0, 0] = 4 # consistant tangent
-#bd.K[0, 1] = 1 # PK2
-#bd.K[0, 2] = 1 # dPK2/dEGL
-for k, v in material_properties.items():
-    mgis_bv.setMaterialProperty(bd.s1, k, v)
-
-bd.s1.gradients[:] = [1, 1, 1, 1, 0]
-bdv = mgis_bv.make_view(bd)
-result = mgis_bv.integrate(bdv, b)
-print(result)
\ No newline at end of file
+
+# MaterialDataManager holds the state of all N points so that a single
+# mgis.behaviour.integrate call vectorizes the MFront kernel over the batch
+dm = mgis_bv.MaterialDataManager(b, N)
+for s in [dm.s0, dm.s1]:
+    for k, v in material_properties.items():
+        mgis_bv.setMaterialProperty(s, k, v)
+    mgis_bv.setExternalStateVariable(s, "Temperature", 293.15)
+
+dm.s1.gradients[:, :] = np.tile([1, 1, 1, 1, 0], (N, 1))
+dm.allocateArrayOfTangentOperatorBlocks()
+dm.K[:, 0, 0] = 4  # consistant tangent
+# dm.K[:, 0, 1] = 1 # PK2
+# dm.K[:, 0, 2] = 1 # dPK2/dEGL
+
+result = mgis_bv.integrate(dm, integration_type, dt, 0, N)
+print(result)
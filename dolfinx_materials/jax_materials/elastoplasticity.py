@@ -10,6 +10,31 @@ def von_Mises_stress(sig):
     return jnp.sqrt(3 / 2.0) * jnp.linalg.norm(dev(sig))
 
 
+def _with_analytical_slope(yield_stress, hardening_slope):
+    """Builds a yield stress function whose derivative is the user-provided
+    analytical hardening slope instead of being traced through autodiff."""
+
+    @jax.custom_jvp
+    def wrapped_yield_stress(p):
+        return yield_stress(p)
+
+    @wrapped_yield_stress.defjvp
+    def wrapped_yield_stress_jvp(primals, tangents):
+        (p,) = primals
+        (p_dot,) = tangents
+        return yield_stress(p), hardening_slope(p) * p_dot
+
+    return wrapped_yield_stress
+
+
+def _setup_yield_stress(yield_stress):
+    """The yield stress can be a single function or a
+    `(yield_stress, hardening_slope)` tuple providing the analytical slope."""
+    if isinstance(yield_stress, (tuple, list)):
+        yield_stress = _with_analytical_slope(*yield_stress)
+    return jax.jit(yield_stress)
+
+
 @jax.jit
 def Hosford_stress(sig, a=10):
     sI = jnp.linalg.eigh(to_mat(sig))[0]
@@ -28,7 +53,7 @@ class vonMisesIsotropicHardening(JAXMaterial):
     def __init__(self, elastic_model, yield_stress):
         super().__init__()
         self.elastic_model = elastic_model
-        self.yield_stress = yield_stress
+        self.yield_stress = _setup_yield_stress(yield_stress)
         self.equivalent_stress = von_Mises_stress
         self.newton_solver = JAXNewton()
 
@@ -88,7 +113,7 @@ class GeneralIsotropicHardening(JAXMaterial):
     def __init__(self, elastic_model, yield_stress, equivalent_stress):
         super().__init__()
         self.elastic_model = elastic_model
-        self.yield_stress = jax.jit(yield_stress)
+        self.yield_stress = _setup_yield_stress(yield_stress)
         self.equivalent_stress = jax.jit(equivalent_stress)
         self.newton_solver = JAXNewton()
 
@@ -1,25 +1,36 @@
+from functools import lru_cache
 import jax.numpy as jnp
-import scipy.linalg as sl
 
 
+@lru_cache
 def Identity(d):
     """2nd rank identity tensor of dimension d"""
     return jnp.eye(d * (d + 1) // 2)
 
 
 # Projector onto isotropic space
-A = 1 / 3.0 * jnp.ones((3, 3))
-J = sl.block_diag(A, jnp.zeros((3, 3)))
+J = jnp.array(
+    [
+        [1 / 3.0, 1 / 3.0, 1 / 3.0, 0, 0, 0],
+        [1 / 3.0, 1 / 3.0, 1 / 3.0, 0, 0, 0],
+        [1 / 3.0, 1 / 3.0, 1 / 3.0, 0, 0, 0],
+        [0, 0, 0, 0, 0, 0],
+        [0, 0, 0, 0, 0, 0],
+        [0, 0, 0, 0, 0, 0],
+    ]
+)
 
 # Projector onto deviatoric space
-B = jnp.array(
+K = jnp.array(
     [
-        [2 / 3.0, -1 / 3.0, -1 / 3.0],
-        [-1 / 3.0, 2 / 3.0, -1 / 3.0],
-        [-1 / 3.0, -1 / 3.0, 2 / 3.0],
+        [2 / 3.0, -1 / 3.0, -1 / 3.0, 0, 0, 0],
+        [-1 / 3.0, 2 / 3.0, -1 / 3.0, 0, 0, 0],
+        [-1 / 3.0, -1 / 3.0, 2 / 3.0, 0, 0, 0],
+        [0, 0, 0, 1, 0, 0],
+        [0, 0, 0, 0, 1, 0],
+        [0, 0, 0, 0, 0, 1],
     ]
 )
-K = sl.block_diag(B, jnp.eye(3))
 
 
 def tr(x):
@@ -7,6 +7,7 @@ MFrontNonlinearMaterial class
 Laboratoire Navier (ENPC,IFSTTAR,CNRS UMR 8205)
 @email: jeremy.bleyer@enpc.fr
 """
+import numpy as np
 import mgis.behaviour as mgis_bv
 from dolfinx_materials import PerformanceWarning
 import subprocess
@@ -15,11 +16,15 @@ import warnings
 
 
 # we filter out brackets from MFront variable names as it messes up with FFCx
-def filter_names(function):
-    def new_function(self):
-        return [f.replace("[", "").replace("]", "") for f in function(self)]
+def _filter_names(names):
+    return [name.replace("[", "").replace("]", "") for name in names]
 
-    return new_function
+
+# module-level caches for repeated instantiations of the same behaviour (e.g.
+# parameter sweeps or inverse-problem loops): both isStandardFiniteStrainBehaviour
+# and mgis_bv.load dlopen the library to introspect it
+_FS_CACHE = {}
+_BEHAVIOUR_CACHE = {}
 
 
 mgis_hypothesis = {
@@ -81,23 +86,101 @@ class MFrontMaterial:
         self.dt = dt
         # Loading the behaviour
         self.load_behaviour(self.path, stress_measure, tangent_operator)
+        self._cache_variable_tables()
 
         self.update_parameters(parameters)
 
     def load_behaviour(self, path, stress_measure, tangent_operator):
-        self.is_finite_strain = mgis_bv.isStandardFiniteStrainBehaviour(path, self.name)
-        if self.is_finite_strain:
-            # finite strain options
-            bopts = mgis_bv.FiniteStrainBehaviourOptions()
-            bopts.stress_measure = stress_measure
-            bopts.tangent_operator = tangent_operator
-            self.behaviour = mgis_bv.load(bopts, path, self.name, self.hypothesis)
-        else:
-            self.behaviour = mgis_bv.load(path, self.name, self.hypothesis)
+        key = (path, self.name)
+        self.is_finite_strain = _FS_CACHE.get(key)
+        if self.is_finite_strain is None:
+            self.is_finite_strain = mgis_bv.isStandardFiniteStrainBehaviour(
+                path, self.name
+            )
+            _FS_CACHE[key] = self.is_finite_strain
+        # the behaviour object is shared between instances loading the same
+        # library with identical options; parameters are applied per instance
+        behaviour_key = key + (self.hypothesis, stress_measure, tangent_operator)
+        self.behaviour = _BEHAVIOUR_CACHE.get(behaviour_key)
+        if self.behaviour is None:
+            if self.is_finite_strain:
+                # finite strain options
+                bopts = mgis_bv.FiniteStrainBehaviourOptions()
+                bopts.stress_measure = stress_measure
+                bopts.tangent_operator = tangent_operator
+                self.behaviour = mgis_bv.load(bopts, path, self.name, self.hypothesis)
+            else:
+                self.behaviour = mgis_bv.load(path, self.name, self.hypothesis)
+            _BEHAVIOUR_CACHE[behaviour_key] = self.behaviour
+
+    def _cache_variable_tables(self):
+        """Materializes variable names and sizes once at load time so that the
+        property accessors do not call back into the MGIS bindings."""
+        behaviour = self.behaviour
+
+        def sizes(variables):
+            return [
+                mgis_bv.getVariableSize(svar, self.hypothesis) for svar in variables
+            ]
+
+        self._material_property_names = [svar.name for svar in behaviour.mps]
+        self._material_property_sizes = sizes(behaviour.mps)
+        self._external_state_variable_names = _filter_names(
+            [svar.name for svar in behaviour.external_state_variables]
+        )
+        self._external_state_variable_sizes = sizes(behaviour.external_state_variables)
+        self._internal_state_variable_names = _filter_names(
+            [svar.name for svar in behaviour.internal_state_variables]
+        )
+        self._internal_state_variable_sizes = sizes(behaviour.internal_state_variables)
+        self._gradient_names = _filter_names(
+            [svar.name for svar in behaviour.gradients]
+        )
+        self._gradient_sizes = sizes(behaviour.gradients)
+        self._flux_names = _filter_names(
+            [svar.name for svar in behaviour.thermodynamic_forces]
+        )
+        self._flux_sizes = sizes(behaviour.thermodynamic_forces)
+        self._tangent_block_names = [
+            (t[0].name, t[1].name) for t in behaviour.tangent_operator_blocks
+        ]
+        self._tangent_block_sizes = [
+            tuple(mgis_bv.getVariableSize(tt, self.hypothesis) for tt in t)
+            for t in behaviour.tangent_operator_blocks
+        ]
+
+    @staticmethod
+    def _build_slices(names, sizes):
+        offsets = np.concatenate(([0], np.cumsum(sizes)))
+        return [
+            (name, slice(offsets[i], offsets[i + 1])) for i, name in enumerate(names)
+        ]
 
     def set_data_manager(self, ngauss):
         # Setting the material data manager
         self.data_manager = mgis_bv.MaterialDataManager(self.behaviour, ngauss)
+        # Precompute the (name, slice) tables used to get/set blocks of the
+        # state arrays without recomputing offsets on every call
+        self._grad_slices = self._build_slices(self.gradient_names, self.gradient_sizes)
+        self._flux_slices = self._build_slices(self.flux_names, self.flux_sizes)
+        self._isv_slices = self._build_slices(
+            self.internal_state_variable_names, self.internal_state_variable_sizes
+        )
+        self.data_manager.allocateArrayOfTangentOperatorBlocks()
+        # TODO Clarify settings of K, if at all necessary, depending on the
+        # PK1/PK2 etc.
+        K = self.data_manager.K
+        K[:, 0, 0] = 4  # Consistent tangent operator
+        K[:, 0, 1] = 1  # 0 - Cauchy, 1 - PK2, 2 - PK1
+        K[:, 0, 2] = 1  # 0 - DCauchy/DDefGrad, 1 - DPK2/DS_DEGL, 2 - PK1/DDefGrad
+        # flattened zero-copy view of the tangent blocks returned by integrate
+        if len(K.shape) == 3:
+            self._K_flat = K.reshape((K.shape[0], -1))
+        else:
+            self._K_flat = K
+        # MGIS-owned gradient buffer, cached to avoid the pybind attribute
+        # chain lookup on every integration call
+        self._grad_buf = self.data_manager.s1.gradients
         self.initialize_external_state_variable("Temperature", 293.15)
         self.update_external_state_variable("Temperature", 293.15)
 
@@ -105,26 +188,40 @@ class MFrontMaterial:
         for key, value in parameters.items():
             self.behaviour.setParameter(key, value)
 
+    @staticmethod
+    def _is_scalar(values):
+        # catches Python scalars as well as 0d NumPy values such as np.float64
+        return np.isscalar(values) or (hasattr(values, "ndim") and values.ndim == 0)
+
+    @staticmethod
+    def _as_local_storage(values):
+        # MGIS expects C-contiguous float64 arrays; enforce this once here
+        # rather than paying a silent copy inside the bindings on every call
+        values = np.asarray(values)
+        if not (values.flags["C_CONTIGUOUS"] and values.dtype == np.float64):
+            values = np.ascontiguousarray(values, dtype=np.float64)
+        return values
+
     def update_material_property(self, name, values):
         for s in [self.data_manager.s0, self.data_manager.s1]:
-            if type(values) in [int, float]:
-                mgis_bv.setMaterialProperty(s, name, values)
+            if self._is_scalar(values):
+                mgis_bv.setMaterialProperty(s, name, float(values))
             else:
                 mgis_bv.setMaterialProperty(
                     s,
                     name,
-                    values,
+                    self._as_local_storage(values),
                     mgis_bv.MaterialStateManagerStorageMode.LocalStorage,
                 )
 
     def _set_external_state_variable(self, state, name, values):
-        if type(values) in [int, float]:
-            mgis_bv.setExternalStateVariable(state, name, values)
+        if self._is_scalar(values):
+            mgis_bv.setExternalStateVariable(state, name, float(values))
         else:
             mgis_bv.setExternalStateVariable(
                 state,
                 name,
-                values,
+                self._as_local_storage(values),
                 mgis_bv.MaterialStateManagerStorageMode.LocalStorage,
             )
 
@@ -143,27 +240,23 @@ class MFrontMaterial:
 
     @property
     def material_property_names(self):
-        return [svar.name for svar in self.behaviour.mps]
+        return self._material_property_names
 
     @property
-    @filter_names
     def external_state_variable_names(self):
-        return [svar.name for svar in self.behaviour.external_state_variables]
+        return self._external_state_variable_names
 
     @property
-    @filter_names
     def internal_state_variable_names(self):
-        return [svar.name for svar in self.behaviour.internal_state_variables]
+        return self._internal_state_variable_names
 
     @property
-    @filter_names
     def gradient_names(self):
-        return [svar.name for svar in self.behaviour.gradients]
+        return self._gradient_names
 
     @property
-    @filter_names
     def flux_names(self):
-        return [svar.name for svar in self.behaviour.thermodynamic_forces]
+        return self._flux_names
 
     @property
     def gradients(self):
@@ -192,53 +285,35 @@ class MFrontMaterial:
 
     @property
     def material_property_sizes(self):
-        return [
-            mgis_bv.getVariableSize(svar, self.hypothesis)
-            for svar in self.behaviour.mps
-        ]
+        return self._material_property_sizes
 
     @property
     def external_state_variable_sizes(self):
-        return [
-            mgis_bv.getVariableSize(svar, self.hypothesis)
-            for svar in self.behaviour.external_state_variables
-        ]
+        return self._external_state_variable_sizes
 
     @property
     def internal_state_variable_sizes(self):
-        return [
-            mgis_bv.getVariableSize(svar, self.hypothesis)
-            for svar in self.behaviour.internal_state_variables
-        ]
+        return self._internal_state_variable_sizes
 
     @property
     def has_internal_state_variables(self):
-        return len(self.behaviour.internal_state_variables) > 0
+        return len(self._internal_state_variable_names) > 0
 
     @property
     def gradient_sizes(self):
-        return [
-            mgis_bv.getVariableSize(svar, self.hypothesis)
-            for svar in self.behaviour.gradients
-        ]
+        return self._gradient_sizes
 
     @property
     def flux_sizes(self):
-        return [
-            mgis_bv.getVariableSize(svar, self.hypothesis)
-            for svar in self.behaviour.thermodynamic_forces
-        ]
+        return self._flux_sizes
 
     @property
     def tangent_block_names(self):
-        return [(t[0].name, t[1].name) for t in self.behaviour.tangent_operator_blocks]
+        return self._tangent_block_names
 
     @property
     def tangent_block_sizes(self):
-        return [
-            tuple([mgis_bv.getVariableSize(tt, self.hypothesis) for tt in t])
-            for t in self.behaviour.tangent_operator_blocks
-        ]
+        return self._tangent_block_sizes
 
     @property
     def tangent_blocks(self):
@@ -247,14 +322,8 @@ class MFrontMaterial:
         }
 
     def integrate(self, eps):
-        self.data_manager.s1.gradients[:, :] = eps
-        # TODO Clarify settings of K, if at all necessary, depending on the
-        # PK1/PK2 etc.
-        self.data_manager.allocateArrayOfTangentOperatorBlocks()
-        K = self.data_manager.K
-        K[:, 0, 0] = 4  # Consistent tangent operator
-        K[:, 0, 1] = 1  # 0 - Cauchy, 1 - PK2, 2 - PK1
-        K[:, 0, 2] = 1  # 0 - DCauchy/DDefGrad, 1 - DPK2/DS_DEGL, 2 - PK1/DDefGrad
+        # a contiguous float64 input hits the fast memcpy path of the upload
+        self._grad_buf[:, :] = self._as_local_storage(eps)
         integrate_status = mgis_bv.integrate(
             self.data_manager, self.integration_type, self.dt, 0, self.data_manager.n
         )
@@ -267,61 +336,34 @@ class MFrontMaterial:
             isv = self.data_manager.s1.internal_state_variables
         else:
             isv = []
-        if len(K.shape) == 3:
-            K = K.reshape((K.shape[0], -1))
         return (
             self.data_manager.s1.thermodynamic_forces,
             isv,
-            K,
+            self._K_flat,
         )
 
     def set_initial_state_dict(self, state):
-        buff = 0
-        for i, s in enumerate(self.gradient_names):
-            block_shape = self.gradient_sizes[i]
-            if (
-                s in state
-            ):  # test if in state so that we can update only a few state variables
-                self.data_manager.s0.gradients[:, buff : buff + block_shape] = state[s]
-            buff += block_shape
-        buff = 0
-        for i, s in enumerate(self.flux_names):
-            block_shape = self.flux_sizes[i]
-            if s in state:
-                self.data_manager.s0.thermodynamic_forces[
-                    :, buff : buff + block_shape
-                ] = state[s]
-            buff += block_shape
-        buff = 0
-        for i, s in enumerate(self.internal_state_variable_names):
-            block_shape = self.internal_state_variable_sizes[i]
-            if s in state:
-                self.data_manager.s0.internal_state_variables[
-                    :, buff : buff + block_shape
-                ] = state[s]
-            buff += block_shape
+        # test if in state so that we can update only a few state variables
+        s0 = self.data_manager.s0
+        for name, sl in self._grad_slices:
+            if name in state:
+                s0.gradients[:, sl] = state[name]
+        for name, sl in self._flux_slices:
+            if name in state:
+                s0.thermodynamic_forces[:, sl] = state[name]
+        for name, sl in self._isv_slices:
+            if name in state:
+                s0.internal_state_variables[:, sl] = state[name]
 
     def get_final_state_dict(self):
-        state = {}
-        buff = 0
-        for i, s in enumerate(self.gradient_names):
-            block_shape = self.gradient_sizes[i]
-            state[s] = self.data_manager.s1.gradients[:, buff : buff + block_shape]
-            buff += block_shape
-        buff = 0
-        for i, s in enumerate(self.flux_names):
-            block_shape = self.flux_sizes[i]
-            state[s] = self.data_manager.s1.thermodynamic_forces[
-                :, buff : buff + block_shape
-            ]
-            buff += block_shape
-        buff = 0
-        for i, s in enumerate(self.internal_state_variable_names):
-            block_shape = self.internal_state_variable_sizes[i]
-            state[s] = self.data_manager.s1.internal_state_variables[
-                :, buff : buff + block_shape
-            ]
-            buff += block_shape
+        s1 = self.data_manager.s1
+        state = {name: s1.gradients[:, sl] for name, sl in self._grad_slices}
+        state.update(
+            {name: s1.thermodynamic_forces[:, sl] for name, sl in self._flux_slices}
+        )
+        state.update(
+            {name: s1.internal_state_variables[:, sl] for name, sl in self._isv_slices}
+        )
         return state
 
     def rotate_gradients(self, gradient_vals, rotation_values):
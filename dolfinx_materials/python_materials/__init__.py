@@ -1 +1,6 @@
 from .elasticity import LinearElasticIsotropic
+
+try:
+    from .elastoplasticity import ElastoPlasticIsotropicHardening
+except ImportError:
+    print("Numba is not available. Numba-based behaviors cannot be used.")
@@ -179,7 +179,7 @@ class NonlinearMaterialProblem(NonlinearProblem):
     This class handles the definition of a nonlinear problem containing an abstract `QuadratureMap` object compatible with a dolfinx NewtonSolver.
     """
 
-    def __init__(self, qmap, F, J, u, bcs):
+    def __init__(self, qmap, F, J, u, bcs, form_compiler_options=None, jit_options=None):
         """
         Parameters
         ----------
@@ -193,10 +193,22 @@ class NonlinearMaterialProblem(NonlinearProblem):
             Unknown function representing the solution
         bcs : list
             list of fem.dirichletbc
+        form_compiler_options : dict, optional
+            FFCx form compiler options, e.g. {"cpp_optimize_flags": "-O3"}
+        jit_options : dict, optional
+            CFFI JIT options for the generated kernels,
+            e.g. {"cffi_extra_compile_args": ["-O3", "-march=native"]}
         """
-        super().__init__(F, u, J=J, bcs=bcs)
+        kwargs = {}
+        if form_compiler_options is not None:
+            kwargs["form_compiler_options"] = form_compiler_options
+        if jit_options is not None:
+            kwargs["jit_options"] = jit_options
+        super().__init__(F, u, J=J, bcs=bcs, **kwargs)
         self._F = None
         self._J = None
+        self._A = None
+        self._b = None
         self.u = u
         if not isinstance(qmap, list):
             self.quadrature_maps = [qmap]
@@ -217,10 +229,15 @@ class NonlinearMaterialProblem(NonlinearProblem):
         self._constitutive_update()
 
     def matrix(self):
-        return create_matrix(self.a)
+        # created once and reused across successive solves
+        if self._A is None:
+            self._A = create_matrix(self.a)
+        return self._A
 
     def vector(self):
-        return create_vector(self.L)
+        if self._b is None:
+            self._b = create_vector(self.L)
+        return self._b
 
     def solve(self, solver, print_solution=True):
         """Solve the problem
@@ -0,0 +1,64 @@
+import numpy as np
+
+from dolfinx_materials.python_materials import (
+    LinearElasticIsotropic,
+    ElastoPlasticIsotropicHardening,
+)
+
+E = 70e3
+nu = 0.3
+sig0 = 350.0
+sigu = 500.0
+b = 100.0
+
+
+def make_material(ngauss):
+    material = ElastoPlasticIsotropicHardening(
+        LinearElasticIsotropic(E, nu), sig0, sigu, b
+    )
+    material.set_data_manager(ngauss)
+    return material
+
+
+def von_Mises_stress(sig):
+    s = sig.copy()
+    s[:, :3] -= sig[:, :3].mean(axis=1, keepdims=True)
+    return np.sqrt(3 / 2.0) * np.linalg.norm(s, axis=1)
+
+
+def test_elastic_step():
+    material = make_material(4)
+    eps = np.zeros((4, 6))
+    eps[:, 0] = 1e-4
+    sig, isv, Ct = material.integrate(eps)
+    assert np.allclose(sig, eps @ material.C.T)
+    assert np.allclose(isv, 0)
+    assert np.allclose(Ct, np.tile(material.C.ravel(), (4, 1)))
+
+
+def test_plastic_consistency():
+    material = make_material(4)
+    eps = np.zeros((4, 6))
+    eps[:, 0] = 2e-2  # uniaxial strain well beyond first yield
+    sig, isv, Ct = material.integrate(eps)
+    p = isv[:, 0]
+    assert np.all(p > 0)
+    # stress state lies on the hardened yield surface
+    sig_Y = sig0 + (sigu - sig0) * (1 - np.exp(-b * p))
+    assert np.allclose(von_Mises_stress(sig), sig_Y, rtol=1e-6)
+
+
+def test_consistent_tangent():
+    material = make_material(1)
+    eps = np.zeros((1, 6))
+    eps[0, 0] = 2e-2
+    sig, _, Ct = material.integrate(eps)
+    sig_ref = sig.copy()
+    h = 1e-6
+    Ct_fd = np.zeros((6, 6))
+    for j in range(6):
+        eps_pert = eps.copy()
+        eps_pert[0, j] += h
+        sig_pert, _, _ = material.integrate(eps_pert)
+        Ct_fd[:, j] = (sig_pert[0] - sig_ref[0]) / h
+    assert np.allclose(Ct.reshape(6, 6), Ct_fd, rtol=1e-3, atol=1.0)